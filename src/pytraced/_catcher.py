@@ -9,33 +9,48 @@ Classes:
 from __future__ import annotations
 
 from contextlib import AbstractContextManager
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from types import TracebackType
 from typing import TYPE_CHECKING, Callable, Iterable, Mapping
+from weakref import WeakValueDictionary
 
 if TYPE_CHECKING:
     from ._levels import Level
     from ._logger import Logger
 
 
-def _issubclass(class_: type, classes: type | Iterable[type]) -> bool:
+def _as_exc_tuple(
+    classes: type[BaseException] | Iterable[type[BaseException]],
+) -> tuple[type[BaseException], ...]:
     """
-    Check if `class_` is a subclass of `classes`. Notably different in that it accepts an
-    iterable of types rather than a tuple like `builtins.issubclass`
+    Normalize a single exception type or an iterable of exception types to a tuple.
 
     Parameters:
-        - `class_`: Class or type to check
-        - `classes`: Class, classes, or types to check against
+        - `classes`: Class or iterable of classes to normalize.
 
-    Returns: Whether or not `class_` is a subclass of `classes`
+    Returns: Tuple of exception types suitable for passing directly to `issubclass`.
     """
-    if hasattr(classes, "__iter__") and callable(classes.__iter__):
-        return issubclass(class_, tuple(classes))
-    return issubclass(class_, classes)  # type: ignore
+    if isinstance(classes, type):
+        return (classes,)
+    return tuple(classes)
+
+
+# Pool of previously constructed catchers keyed by their argument tuple. `Catcher` is frozen
+# and stateless between uses, so one instance can safely be reused across invocations. The
+# values are held weakly: decorator closures keep their catcher (and thereby its id-based
+# key) alive for reuse, while one-shot `catch_context` entries are reclaimed after use
+# instead of accumulating per distinct argument set.
+_catcher_pool: WeakValueDictionary[tuple[object, ...], Catcher] = WeakValueDictionary()
+
+
+class _SupportsWeakRef:  # pylint: disable=too-few-public-methods
+    """Mixin giving the slotted `Catcher` weak-reference support without an instance dict."""
+
+    __slots__ = ("__weakref__",)
 
 
 @dataclass(slots=True, frozen=True)
-class Catcher(AbstractContextManager[None]):
+class Catcher(AbstractContextManager[None], _SupportsWeakRef):
     """
     This class is an implementation of `ContextManager[None]` and is designed to be used by the
     `Logger` to catch and log runtime exceptions.
@@ -50,6 +65,74 @@ class Catcher(AbstractContextManager[None]):
     reraise: bool
     on_error: Callable[[BaseException], None] | None
     extra_info: Mapping[str, object] | None
+    _stack_level: int = field(init=False, repr=False)
+    _suppress: bool = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        # normalize to tuples once so `__exit__` can use the C-level `issubclass` fast path
+        if not isinstance(self.exc_types, tuple):
+            object.__setattr__(self, "exc_types", _as_exc_tuple(self.exc_types))
+
+        if self.exclude is not None and not isinstance(self.exclude, tuple):
+            object.__setattr__(self, "exclude", _as_exc_tuple(self.exclude))
+
+        # precompute the values `__exit__` needs on the exception path
+        object.__setattr__(self, "_stack_level", 3 if self.from_decorator else 2)
+        object.__setattr__(self, "_suppress", not self.reraise)
+
+    @classmethod
+    def get(
+        cls,
+        from_decorator: bool,
+        logger: Logger,
+        message: object,
+        level: str | Level,
+        exc_types: type[BaseException] | Iterable[type[BaseException]],
+        exclude: type[BaseException] | Iterable[type[BaseException]] | None,
+        reraise: bool,
+        on_error: Callable[[BaseException], None] | None,
+        extra_info: Mapping[str, object] | None,
+    ) -> Catcher:
+        """
+        Return a pooled `Catcher` for the given arguments, constructing one on the first use.
+        Since catchers are immutable, call sites which repeatedly enter the same configuration
+        (decorators, `catch_context` in a loop) reuse a single instance.
+
+        Parameters: identical to the `Catcher` constructor.
+
+        Returns: `Catcher` - Pooled or newly constructed instance.
+        """
+        exc_types = _as_exc_tuple(exc_types) if not isinstance(exc_types, tuple) else exc_types
+        if exclude is not None and not isinstance(exclude, tuple):
+            exclude = _as_exc_tuple(exclude)
+
+        key = (
+            from_decorator,
+            id(logger),
+            id(message),
+            id(level),
+            exc_types,
+            exclude,
+            reraise,
+            id(on_error),
+            id(extra_info),
+        )
+
+        catcher = _catcher_pool.get(key)
+        if catcher is None:
+            catcher = _catcher_pool[key] = cls(
+                from_decorator,
+                logger,
+                message,
+                level,
+                exc_types,
+                exclude,
+                reraise,
+                on_error,
+                extra_info,
+            )
+
+        return catcher
 
     def __enter__(self) -> None:
         return None
@@ -63,10 +146,12 @@ class Catcher(AbstractContextManager[None]):
         if exc_type is None:
             return None
 
-        if not _issubclass(exc_type, self.exc_types):
+        if not issubclass(exc_type, self.exc_types):  # type: ignore[arg-type]
             return False
 
-        if self.exclude is not None and _issubclass(exc_type, self.exclude):
+        if self.exclude is not None and issubclass(
+            exc_type, self.exclude  # type: ignore[arg-type]
+        ):
             return False
 
         self.logger._log(
@@ -74,10 +159,10 @@ class Catcher(AbstractContextManager[None]):
             self.message,
             exc,
             self.extra_info,
-            3 if self.from_decorator else 2,  # increase stack level for decorators
+            self._stack_level,  # increased stack level for decorators
         )
 
         if self.on_error is not None:
             self.on_error(exc)  # type: ignore
 
-        return not self.reraise
+        return self._suppress
@@ -6,7 +6,7 @@ This file contains all of the classes used for interacting with and constructing
 Classes:
     - `Config` - Class used for storing a logging configuration.
 """
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from re import compile as compile_re
 from typing import Callable, ClassVar, final
 
@@ -28,9 +28,10 @@ class Config:
         - `DEFAULT_TRACE` - Default trace style.
         - `CACHE_FORMATTED_DATETIMES` - Controls the use an lru cache for previously formatted
                                         datetimes (maxsize=6). Defaults to true.
-        - `CACHE_FORMATTED_PATHS` - Controls the use an unbounded cache for previously formatted
-                                    paths to the files from which logs originate (maxsize=None).
-                                    Defaults to true.
+        - `CACHE_FORMATTED_PATHS` - Controls the use of a cache for previously formatted paths
+                                    to the files from which logs originate. Defaults to true.
+        - `FORMATTED_PATHS_CACHE_SIZE` - Maximum number of formatted paths to retain when
+                                         `CACHE_FORMATTED_PATHS` is enabled. Defaults to 1024.
 
     Attributes:
         - `formatter` - Either a function which takes in a record and return the formatted string
@@ -48,8 +49,60 @@ class Config:
     DEFAULT_TRACE: ClassVar = "clean"
     CACHE_FORMATTED_DATETIMES: ClassVar = True
     CACHE_FORMATTED_PATHS: ClassVar = True
+    FORMATTED_PATHS_CACHE_SIZE: ClassVar = 1024
 
     formatter: Callable[[Record], str] | str
     filter_func: Callable[[Record], bool] | None
     colourise: bool
     min_level: int
+    _compiled: tuple[tuple[int, object], ...] | None = field(
+        init=False, repr=False, compare=False
+    )
+    _emit: Callable[[Record], str] | None = field(init=False, repr=False, compare=False)
+    _uses_datetime: bool = field(init=False, repr=False, compare=False)
+    _uses_frame: bool = field(init=False, repr=False, compare=False)
+    _uses_process: bool = field(init=False, repr=False, compare=False)
+    _uses_thread: bool = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        if isinstance(self.formatter, str):
+            # deferred import as `_formatter` imports this module for the parser & defaults
+            from ._formatter import (  # pylint: disable=import-outside-toplevel, cyclic-import
+                _OP_GLOBAL_NAME,
+                _OP_PROCESS_ID,
+                _OP_PROCESS_NAME,
+                _OP_THREAD_ID,
+                _OP_THREAD_NAME,
+                _OP_TIME,
+                _OP_TRACE,
+                _codegen_format,
+                _compile_format,
+            )
+
+            compiled = _compile_format(self.formatter)
+            ops = {op for op, _ in compiled}
+            object.__setattr__(self, "_compiled", compiled)
+            object.__setattr__(self, "_emit", _codegen_format(compiled))
+            object.__setattr__(self, "_uses_datetime", _OP_TIME in ops)
+            object.__setattr__(
+                self, "_uses_frame", not ops.isdisjoint((_OP_TRACE, _OP_GLOBAL_NAME))
+            )
+            object.__setattr__(
+                self, "_uses_process", not ops.isdisjoint((_OP_PROCESS_NAME, _OP_PROCESS_ID))
+            )
+            object.__setattr__(
+                self, "_uses_thread", not ops.isdisjoint((_OP_THREAD_NAME, _OP_THREAD_ID))
+            )
+        else:
+            if not callable(self.formatter):
+                raise TypeError(
+                    "formatter must be a format string or a callable, "
+                    f"not {type(self.formatter).__name__!r}"
+                )
+            object.__setattr__(self, "_compiled", None)
+            object.__setattr__(self, "_emit", None)
+            # a callable formatter may read any record field
+            object.__setattr__(self, "_uses_datetime", True)
+            object.__setattr__(self, "_uses_frame", True)
+            object.__setattr__(self, "_uses_process", True)
+            object.__setattr__(self, "_uses_thread", True)
@@ -4,17 +4,39 @@ _datetime.py:
 This file contains all of the functions required to format `datetime` objects for printing.
 
 Functions:
+    - `get_datetime` - Get the current local datetime.
     - `format_datetime` - Format the given datetime with the custom datetime specifiers.
 """
 from calendar import day_abbr, day_name, month_abbr, month_name
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from functools import lru_cache
 from re import compile as compile_re
+from time import time
 from typing import Callable, Mapping
 
 from ._config import Config
 
 
+def get_datetime(
+    # bound as defaults so this per-log call pays no global or attribute lookups
+    _fromtimestamp: Callable[[float], datetime] = datetime.fromtimestamp,
+    _time: Callable[[], float] = time,
+) -> datetime:
+    """
+    Get the current local datetime. Equivalent to `datetime.now()` with the lookup chain
+    pre-bound, as this runs once per log record.
+
+    Returns: `datetime` - Current local datetime.
+    """
+    return _fromtimestamp(_time())
+
+
+# Maps offset seconds to the formatted offset string. Timezones rarely change within a
+# process (DST shifts yield ~2 keys), so this stays tiny while skipping the timedelta
+# arithmetic on every record.
+_utc_offset_cache: dict[float, str] = {}
+
+
 def _get_utc_offset(date_time: datetime) -> str | None:
     """Return the formatted UTC timezone offset if the `datetime` object has a timezone.
 
@@ -29,6 +51,11 @@ def _get_utc_offset(date_time: datetime) -> str | None:
     if offset is None:
         return None
 
+    key = offset.total_seconds()
+    cached = _utc_offset_cache.get(key)
+    if cached is not None:
+        return cached
+
     sign = "+"
 
     if offset.days < 0:
@@ -41,14 +68,31 @@ def _get_utc_offset(date_time: datetime) -> str | None:
     microseconds = offset.microseconds
 
     if microseconds:
-        return f"{sign}{hours:02}{minutes:02}{seconds:02}.{microseconds:06}"
+        formatted = f"{sign}{hours:02}{minutes:02}{seconds:02}.{microseconds:06}"
+    elif seconds:
+        formatted = f"{sign}{hours:02}{minutes:02}{seconds:02}"
+    else:
+        formatted = f"{sign}{hours:02}{minutes:02}"
+
+    _utc_offset_cache[key] = formatted
+    return formatted
+
+
+@lru_cache(maxsize=2)
+def _year_start_ordinal(year: int) -> int:
+    """Return the proleptic Gregorian ordinal of the first day of the given year."""
+    return date(year, 1, 1).toordinal()
 
-    if seconds:
-        return f"{sign}{hours:02}{minutes:02}{seconds:02}"
 
-    return f"{sign}{hours:02}{minutes:02}"
+def _day_of_year(date_time: datetime) -> int:
+    """Return the day of the year [1, 366] without building a full `struct_time`."""
+    return date_time.toordinal() - _year_start_ordinal(date_time.year) + 1
 
 
+# two-digit strings indexed by value; one tuple index replaces interpreting a padded
+# format spec for the month/day/hour/minute/second tokens on every record
+_TWO_DIGIT = tuple(f"{i:02}" for i in range(100))
+
 # Maps date format tokens to a function which returns the tokens value.
 _DATE_TOKEN_MAP: Mapping[str, Callable[[datetime], str]] = {
     # fmt: off
@@ -59,29 +103,29 @@ _DATE_TOKEN_MAP: Mapping[str, Callable[[datetime], str]] = {
 
     "MMMM": lambda d: month_name[d.month],                         # month name
     "MMM": lambda d: month_abbr[d.month],                          # month abbreviation
-    "MM": lambda d: f"{d.month:02}",                               # zero-padded month number
+    "MM": lambda d: _TWO_DIGIT[d.month],                           # zero-padded month number
     "M": lambda d: str(d.month),                                   # month number
 
-    "DDDD": lambda d: f"{d.timetuple().tm_yday:03}",               # zero-padded day of the year
-    "DDD": lambda d: str(d.timetuple().tm_yday),                   # day of the year
-    "DD": lambda d: f"{d.day:02}",                                 # zero-padded day of the month
+    "DDDD": lambda d: f"{_day_of_year(d):03}",                     # zero-padded day of the year
+    "DDD": lambda d: str(_day_of_year(d)),                         # day of the year
+    "DD": lambda d: _TWO_DIGIT[d.day],                             # zero-padded day of the month
     "D": lambda d: str(d.day),                                     # day of the month
 
-    "ddd": lambda d: day_name[d.timetuple().tm_wday],              # day name
-    "dd": lambda d: day_abbr[d.timetuple().tm_wday],               # day abbreviation
-    "d": lambda d: str(d.timetuple().tm_wday),                     # day of the week
+    "ddd": lambda d: day_name[d.weekday()],                        # day name
+    "dd": lambda d: day_abbr[d.weekday()],                         # day abbreviation
+    "d": lambda d: str(d.weekday()),                               # day of the week
 
     "A": lambda d: "AM" if d.hour < 12 else "PM",                  # am or pm
 
-    "HH": lambda d: f"{((d.hour - 1) % 12) + 1:02}",               # zero-padded 12 hour
+    "HH": lambda d: _TWO_DIGIT[((d.hour - 1) % 12) + 1],           # zero-padded 12 hour
     "H": lambda d: str(((d.hour - 1) % 12) + 1),                   # 12 hour
-    "hh": lambda d: f"{d.hour:02}",                                # zero-padded 24 hour
+    "hh": lambda d: _TWO_DIGIT[d.hour],                            # zero-padded 24 hour
     "h": lambda d: str(d.hour),                                    # 24 hour
 
-    "mm": lambda d: f"{d.minute:02}",                              # zero-padded minute
+    "mm": lambda d: _TWO_DIGIT[d.minute],                          # zero-padded minute
     "m": lambda d: str(d.minute),                                  # minute
 
-    "ss": lambda d: f"{d.second:02}",                              # zero-padded second
+    "ss": lambda d: _TWO_DIGIT[d.second],                          # zero-padded second
     "s": lambda d: str(d.second),                                  # second
 
     "SSSSSS": lambda d: f"{d.microsecond:06}",                     # 6 digit zero-padded microsecond
@@ -100,7 +144,52 @@ _DATE_TOKEN_MAP: Mapping[str, Callable[[datetime], str]] = {
 _DATE_TOKEN_REGEXP = compile_re(f"({'|'.join(_DATE_TOKEN_MAP.keys())})+?")
 
 
-def format_datetime(date_time: datetime, fmt: str) -> str:
+@lru_cache(maxsize=64)
+def _compile_datetime_format(
+    fmt: str,
+) -> tuple[tuple[str, None] | tuple[None, Callable[[datetime], str]], ...]:
+    """
+    Parse a datetime format once into a sequence of `(literal, formatter)` pairs where
+    exactly one element is populated.
+
+    Parameters:
+        - `fmt` - Datetime format string using the custom token mapping.
+
+    Returns: Compiled pairs which `format_datetime` interleaves into the output.
+    """
+    ops: list[tuple[str, None] | tuple[None, Callable[[datetime], str]]] = []
+    last_end = 0
+
+    for match in _DATE_TOKEN_REGEXP.finditer(fmt):
+        if literal := fmt[last_end : match.start()]:
+            ops.append((literal, None))
+        last_end = match.end()
+        ops.append((None, _DATE_TOKEN_MAP[match.group()]))
+
+    if literal := fmt[last_end:]:
+        ops.append((literal, None))
+
+    return tuple(ops)
+
+
+def _format_default_datetime(date_time: datetime) -> str:
+    """
+    Format a given `datetime` object directly with the default datetime format.
+
+    Parameters:
+        - `date_time` - `datetime` object which represents the time to format.
+
+    Returns: Datetime formatted as `Config.DEFAULT_TIME` would produce.
+    """
+    return (
+        f"{date_time.year:04}-{_TWO_DIGIT[date_time.month]}-{_TWO_DIGIT[date_time.day]} "
+        f"{_TWO_DIGIT[date_time.hour]}:{_TWO_DIGIT[date_time.minute]}:"
+        f"{_TWO_DIGIT[date_time.second]}.{date_time.microsecond // 1_000:03} "
+        f"{_get_utc_offset(date_time.astimezone()) or 'N/A'}"
+    )
+
+
+def _format_datetime(date_time: datetime, fmt: str) -> str:
     """
     Format a given `datetime` object using the custom token mapping.
 
@@ -110,8 +199,30 @@ def format_datetime(date_time: datetime, fmt: str) -> str:
 
     Returns: Formatted datetime.
     """
-    return _DATE_TOKEN_REGEXP.sub(lambda m: _DATE_TOKEN_MAP[m.group()](date_time), fmt)
+    return "".join(
+        literal if literal is not None else token(date_time)  # type: ignore[misc]
+        for literal, token in _compile_datetime_format(fmt)
+    )
+
+
+def format_datetime(date_time: datetime, fmt: str) -> str:
+    """
+    Format a given `datetime` object using the custom token mapping. The default format is
+    specialized into a single direct formatting call as it is used on every log unless
+    overridden.
+
+    Parameters:
+        - `date_time` - `datetime` object which represents the time to format.
+        - `fmt` - Format to use with strftime.
+
+    Returns: Formatted datetime.
+    """
+    if fmt == Config.DEFAULT_TIME:
+        return _format_default_datetime(date_time)
+    return _format_datetime(date_time, fmt)
 
 
 if Config.CACHE_FORMATTED_DATETIMES:
-    format_datetime = lru_cache(maxsize=6)(format_datetime)
+    # only the token-mapping fallback is cached; the microsecond field makes default-format
+    # keys effectively unique, which would only pollute the cache
+    _format_datetime = lru_cache(maxsize=6)(_format_datetime)
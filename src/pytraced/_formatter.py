@@ -5,17 +5,20 @@ This file contains all of the functions required to format `Record`s according t
 
 Functions:
     - `format_record` - Get a string with the info from a record according to the config.
+    - `format_records` - Get the strings for a batch of records according to the config.
 """
-from enum import Enum, auto
+from datetime import datetime
 from functools import lru_cache
-from os.path import basename
+from os.path import sep
 from pathlib import Path
-from traceback import extract_stack, format_exception, format_stack
+from sys import intern
+from traceback import format_exception, format_stack
+from types import FrameType, TracebackType
+from typing import Callable, cast
 
 from ._config import Config
 from ._datetime import format_datetime
 from ._record import Record
-from .colours import add_colours
 
 
 class InvalidFormatSpecifierError(Exception):
@@ -25,16 +28,130 @@ class InvalidFormatSpecifierError(Exception):
     """
 
 
-class _TracebackStyles(Enum):
+# Opcodes for compiled format strings. Each format string is parsed once by `_compile_format`
+# into a linear program of `(opcode, argument)` pairs which `_format` then replays with a
+# single integer comparison per instruction. Ordered roughly by expected frequency.
+_OP_LITERAL = 0  # arg: literal string to emit verbatim
+_OP_MESSAGE = 1  # arg: None
+_OP_LEVEL = 2  # arg: None
+_OP_TIME = 3  # arg: datetime format string
+_OP_TRACE = 4  # arg: traceback style code (int)
+_OP_LOGGER_NAME = 5  # arg: None
+_OP_GLOBAL_NAME = 6  # arg: None
+_OP_PROCESS_NAME = 7  # arg: None
+_OP_PROCESS_ID = 8  # arg: None
+_OP_THREAD_NAME = 9  # arg: None
+_OP_THREAD_ID = 10  # arg: None
+_OP_EXTRA = 11  # arg: raw specifier to look up in `record.extra_info`
+
+# Integer codes for the traceback styles; the compiled ops carry these so the dispatch in
+# `_run_format` is a plain integer compare.
+_TRACE_BARE, _TRACE_SIMPLE, _TRACE_CLEAN, _TRACE_DETAILED, _TRACE_FULL = range(5)
+_TRACE_STYLES = {
+    "bare": _TRACE_BARE,
+    "simple": _TRACE_SIMPLE,
+    "clean": _TRACE_CLEAN,
+    "detailed": _TRACE_DETAILED,
+    "full": _TRACE_FULL,
+}
+
+# Maps the fixed format specifiers to their opcode. Keys are interned so compile-time
+# lookups of interned tokens short-circuit on pointer identity before comparing contents.
+_SPECIFIER_OPS: dict[str, int] = {
+    intern(specifier): op
+    for specifier, op in (
+        ("%{name}%", _OP_LOGGER_NAME),
+        ("%{logger-name}%", _OP_LOGGER_NAME),
+        ("%{lvl}%", _OP_LEVEL),
+        ("%{level}%", _OP_LEVEL),
+        ("%{gname}%", _OP_GLOBAL_NAME),
+        ("%{global-name}%", _OP_GLOBAL_NAME),
+        ("%{pname}%", _OP_PROCESS_NAME),
+        ("%{process-name}%", _OP_PROCESS_NAME),
+        ("%{pid}%", _OP_PROCESS_ID),
+        ("%{process-identifier}%", _OP_PROCESS_ID),
+        ("%{tname}%", _OP_THREAD_NAME),
+        ("%{thread-name}%", _OP_THREAD_NAME),
+        ("%{tid}%", _OP_THREAD_ID),
+        ("%{thread-identifier}%", _OP_THREAD_ID),
+        ("%{msg}%", _OP_MESSAGE),
+        ("%{message}%", _OP_MESSAGE),
+    )
+}
+
+
+# module-level sentinel for extra-info lookups so no fresh object is allocated per record
+_MISSING = object()
+
+# One-slot cache for the most recently formatted exception. A record fanned out to several
+# sinks formats the same exception back to back; the entries are strong references (builtin
+# exceptions don't support weak ones) and are matched on both the exception and its
+# traceback identity, since re-raising replaces `__traceback__` and invalidates the text.
+# Only the latest exception is pinned, and only until the next one is formatted.
+_last_exc: BaseException | None = None
+_last_exc_tb: TracebackType | None = None
+_last_exc_text = ""
+
+
+def _format_exc(exc: BaseException) -> str:
     """
-    Enum containing all available traceback styles. This class is used clarity when formatting.
+    Format an exception and its traceback, reusing the result when the same exception is
+    formatted consecutively (e.g. one record dispatched to multiple sinks).
+
+    Parameters:
+        - `exc: BaseException` - Exception to format.
+
+    Returns: `str` - Fully formatted traceback text.
+    """
+    global _last_exc, _last_exc_tb, _last_exc_text  # pylint: disable=global-statement
+
+    if exc is _last_exc and exc.__traceback__ is _last_exc_tb:
+        return _last_exc_text
+
+    text = "".join(format_exception(exc))
+    _last_exc, _last_exc_tb, _last_exc_text = exc, exc.__traceback__, text
+    return text
+
+
+def _msg_part(record: Record) -> str:
+    """Emit the message of a record, expanding any format specifiers it contains."""
+    if "%{" not in record.message:
+        return record.message
+    return _run_format(_compile_format(record.message), record, _from_msg=True)
+
+
+def _extra_part(record: Record, specifier: str) -> str:
     """
+    Emit the value of a specifier resolved against `record.extra_info`.
+
+    Raises:
+        - `InvalidFormatSpecifierError` - Raised if the specifier cannot be resolved.
+    """
+    if not record.extra_info:
+        raise InvalidFormatSpecifierError(f"Format specifier {specifier!r} does not exist")
+
+    info = record.extra_info.get(specifier, _MISSING)
+    if info is _MISSING:
+        raise InvalidFormatSpecifierError(f"Format specifier {specifier!r} does not exist")
 
-    bare = auto()
-    simple = auto()
-    clean = auto()
-    detailed = auto()
-    full = auto()
+    return str(info)
+
+
+if sep == "/":
+
+    def _basename(str_path: str) -> str:
+        """Return the final component of a path; a single rfind on POSIX separators."""
+        return intern(str_path[str_path.rfind("/") + 1 :])
+
+else:
+
+    def _basename(str_path: str) -> str:
+        """Return the final component of a path, accepting either separator on Windows."""
+        return intern(str_path[max(str_path.rfind("/"), str_path.rfind("\\")) + 1 :])
+
+# cached once at import; `Path.cwd()` is a syscall and `Path` construction allocates,
+# neither of which should be paid per formatted path
+_CWD_PREFIX = str(Path.cwd()) + sep
 
 
 def _format_path(str_path: str) -> str:
@@ -46,108 +163,248 @@ def _format_path(str_path: str) -> str:
 
     Returns: `str` - Formatted path.
     """
+    # derived paths are interned; `co_filename` already is, and logging repeatedly from
+    # the same file should hash the slice once rather than per lru_cache/dict lookup
+    if str_path.startswith(_CWD_PREFIX):
+        return intern(str_path[len(_CWD_PREFIX) :])
+    return str_path
 
-    # `Path.is_relative_to` is determined by a conditional error, so the below is a simplification
-    try:
-        return str(Path(str_path).relative_to(Path.cwd()))
-    except ValueError:
-        return str_path
 
+def _trace_bare(record: Record) -> str:
+    """Emit the `bare` trace style: source filename and line number."""
+    frame = record.frame
+    # `_basename` is used to avoid memory allocation of creating a `Path`
+    return f"{_basename(frame.f_code.co_filename)}:{frame.f_lineno}"
 
-def _format(format_str: str, record: Record, *, _from_msg: bool = False) -> str:
+
+def _trace_simple(record: Record) -> str:
+    """Emit the `simple` trace style: global name, enclosing function, and line number."""
+    frame = record.frame
+    return f"{record.global_name}@{frame.f_code.co_name}:{frame.f_lineno}"
+
+
+def _trace_clean(record: Record) -> str:
+    """Emit the `clean` trace style: relative path, enclosing function, and line number."""
+    f_code = record.frame.f_code
+    return f"{_format_path(f_code.co_filename)}@{f_code.co_name}:{record.frame.f_lineno}"
+
+
+def _trace_detailed(record: Record) -> str:
+    """Emit the `detailed` trace style: the `clean` information for the entire stack."""
+    # walk the frame chain directly; `extract_stack` would also read every frame's source
+    # line through `linecache`, which this style never prints
+    frames: list[str] = []
+    frame: FrameType | None = record.frame
+    while frame is not None:
+        f_code = frame.f_code
+        frames.append(
+            f"{_format_path(f_code.co_filename)}@{f_code.co_name}:{frame.f_lineno}"
+        )
+        frame = frame.f_back
+
+    return " -> ".join(reversed(frames))
+
+
+def _trace_full(record: Record) -> str:
+    """Emit the `full` trace style: the full unchanged python traceback."""
+    return "\n{}\n".format("\n".join(format_stack(record.frame)))
+
+
+# indexed by the `_TRACE_*` style codes carried in compiled ops
+_TRACE_EMITTERS = (_trace_bare, _trace_simple, _trace_clean, _trace_detailed, _trace_full)
+
+
+@lru_cache(maxsize=256)
+def _compile_format(format_str: str) -> tuple[tuple[int, object], ...]:
     """
-    Format a the format string with the information from the record according the to config.
+    Parse a format string once into a linear program of `(opcode, argument)` pairs.
 
     Parameters:
-        - `format_str: str` - Format string which dictates where the info from the record should go.
-        - `record: Record` - Record which contains all of the information to include in the log.
+        - `format_str: str` - Format string which dictates where the info from a record should go.
 
-    Returns: `str` - String containing the info from the record according the to config.
+    Returns: `tuple[tuple[int, object], ...]` - Compiled program for `_format` to replay.
 
     Raises:
-        - `InvalidFormatSpecifierError` - Raised if parser encounters an invalid format specifier.
+        - `InvalidFormatSpecifierError` - Raised if an invalid trace style is encountered.
     """
+    ops: list[tuple[int, object]] = []
     last_end = 0
-    logging_string = ""
+
     for match in Config.FORMAT_PARSER.finditer(format_str):
-        logging_string += format_str[last_end : match.start()]
+        if literal := format_str[last_end : match.start()]:
+            ops.append((_OP_LITERAL, literal))
         last_end = match.end()
-        cur_fmt = match.group()
+        cur_fmt = intern(match.group())
 
-        if cur_fmt in ("%{name}%", "%{logger-name}%"):
-            logging_string += record.logger_name
-        elif cur_fmt in ("%{lvl}%", "%{level}%"):
-            logging_string += record.level.name
+        known_op = _SPECIFIER_OPS.get(cur_fmt)
+        if known_op is not None:
+            ops.append((known_op, None))
         elif cur_fmt.startswith("%{time"):
-            logging_string += format_datetime(
-                record.date_time,
-                Config.DEFAULT_TIME if cur_fmt == "%{time}%" else cur_fmt[7:-2],
-                # the slice [7:-2] isolates the datetime format. Exg: "%{time:YYYY}%" -> "YYYY"
+            # the slice [7:-2] isolates the datetime format. Exg: "%{time:YYYY}%" -> "YYYY"
+            ops.append(
+                (
+                    _OP_TIME,
+                    Config.DEFAULT_TIME if cur_fmt == "%{time}%" else cur_fmt[7:-2],
+                )
             )
         elif cur_fmt.startswith("%{trace"):
             style = Config.DEFAULT_TRACE if cur_fmt == "%{trace}%" else cur_fmt[8:-2]
             # the slice [8:-2] isolates the trace style. Exg: "%{trace:bare}%" -> "bare"
 
-            if style == _TracebackStyles.bare.name:
-                # `basename` is used to avoid memory allocation of creating a `Path`
-                logging_string += (
-                    f"{basename(record.frame.f_code.co_filename)}:"
-                    f"{record.frame.f_lineno}"
-                )
-            elif style == _TracebackStyles.simple.name:
-                logging_string += (
-                    f"{record.global_name}@{record.frame.f_code.co_name}:"
-                    f"{record.frame.f_lineno}"
-                )
-            elif style == _TracebackStyles.clean.name:
-                logging_string += (
-                    f"{_format_path(record.frame.f_code.co_filename)}@"
-                    f"{record.frame.f_code.co_name}:{record.frame.f_lineno}"
-                )
-            elif style == _TracebackStyles.detailed.name:
-                logging_string += " -> ".join(
-                    f"{_format_path(trace.filename)}@{trace.name}:{trace.lineno}"
-                    for trace in extract_stack(record.frame)
-                )
-            elif style == _TracebackStyles.full.name:
-                logging_string += "\n{}\n".format("\n".join(format_stack(record.frame)))
-            else:
+            style_value = _TRACE_STYLES.get(style)
+            if style_value is None:
                 raise InvalidFormatSpecifierError(
                     f"Trace style {style!r} does not exist"
                 )
-        elif cur_fmt in ("%{gname}%", "%{global-name}%"):
-            logging_string += record.global_name
-        elif cur_fmt in ("%{pname}%", "%{process-name}%"):
-            logging_string += record.process.name
-        elif cur_fmt in ("%{pid}%", "%{process-identifier}%"):
-            logging_string += str(record.process.ident)
-        elif cur_fmt in ("%{tname}%", "%{thread-name}%"):
-            logging_string += record.thread.name
-        elif cur_fmt in ("%{tid}%", "%{thread-identifier}%"):
-            logging_string += str(record.thread.ident)
-        elif cur_fmt in ("%{msg}%", "%{message}%"):
-            # stops infinite recursion when a message contains "%{msg}%" or "%{message}%"
-            if _from_msg:
-                logging_string += record.message
+
+            ops.append((_OP_TRACE, style_value))
+        else:
+            # unknown specifiers can only be resolved at runtime against `record.extra_info`
+            ops.append((_OP_EXTRA, cur_fmt))
+
+    if literal := format_str[last_end:]:
+        ops.append((_OP_LITERAL, literal))
+
+    return tuple(ops)
+
+
+def _run_format(
+    ops: tuple[tuple[int, object], ...],
+    record: Record,
+    *,
+    _from_msg: bool = False,
+    # bound as defaults so the hot loop uses LOAD_FAST instead of LOAD_GLOBAL
+    _format_datetime: Callable[[datetime, str], str] = format_datetime,
+    _trace_emitters: tuple[Callable[[Record], str], ...] = _TRACE_EMITTERS,
+) -> str:
+    """
+    Execute a compiled format program with the information from the record.
+
+    Parameters:
+        - `ops: tuple[tuple[int, object], ...]` - Program produced by `_compile_format`.
+        - `record: Record` - Record which contains all of the information to include in the log.
+
+    Returns: `str` - String containing the info from the record according the to config.
+
+    Raises:
+        - `InvalidFormatSpecifierError` - Raised if an unknown specifier cannot be resolved.
+    """
+    parts: list[str] = []
+    append = parts.append
+
+    for op, arg in ops:
+        if op == _OP_LITERAL:
+            append(arg)  # type: ignore[arg-type]
+        elif op == _OP_MESSAGE:
+            # `_from_msg` stops infinite recursion when a message itself contains "%{msg}%";
+            # the substring check skips compiling messages without any specifier at all
+            if _from_msg or "%{" not in record.message:
+                append(record.message)
             else:
                 # recurse to expand message contents. Exg "%{msg}%" -> "%{time:YYYY}%"
-                logging_string += _format(record.message, record, _from_msg=True)
-        else:
-            if not record.extra_info:
-                raise InvalidFormatSpecifierError(
-                    f"Format specifier {cur_fmt!r} does not exist"
-                )
+                append(_format(record.message, record, _from_msg=True))
+        elif op == _OP_LEVEL:
+            append(record.level.name)
+        elif op == _OP_TIME:
+            append(_format_datetime(record.date_time, arg))  # type: ignore[arg-type]
+        elif op == _OP_TRACE:
+            append(_trace_emitters[cast(int, arg)](record))
+        elif op == _OP_LOGGER_NAME:
+            append(record.logger_name)
+        elif op == _OP_GLOBAL_NAME:
+            append(record.global_name)
+        elif op == _OP_PROCESS_NAME:
+            append(record.process.name)
+        elif op == _OP_PROCESS_ID:
+            append(str(record.process.ident))
+        elif op == _OP_THREAD_NAME:
+            append(record.thread.name)
+        elif op == _OP_THREAD_ID:
+            append(str(record.thread.ident))
+        else:  # _OP_EXTRA
+            append(_extra_part(record, arg))  # type: ignore[arg-type]
+
+    return "".join(parts)
 
-            missing = object()
-            info = record.extra_info.get(cur_fmt, missing)
-            if info is missing:
-                raise InvalidFormatSpecifierError(
-                    f"Format specifier {cur_fmt!r} does not exist"
-                )
 
-            logging_string += str(info)
+def _format(format_str: str, record: Record, *, _from_msg: bool = False) -> str:
+    """
+    Format a the format string with the information from the record according the to config.
+
+    Parameters:
+        - `format_str: str` - Format string which dictates where the info from the record should go.
+        - `record: Record` - Record which contains all of the information to include in the log.
+
+    Returns: `str` - String containing the info from the record according the to config.
+
+    Raises:
+        - `InvalidFormatSpecifierError` - Raised if parser encounters an invalid format specifier.
+    """
+    # the parser cannot match without this substring, so literal strings pass straight through
+    if "%{" not in format_str:
+        return format_str
+
+    return _run_format(_compile_format(format_str), record, _from_msg=_from_msg)
+
 
-    return logging_string + format_str[last_end:]
+# expression template for each opcode in generated emitters; TIME, TRACE & EXTRA are
+# parameterised and handled separately in `_codegen_format`
+_CODEGEN_EXPRS = {
+    _OP_MESSAGE: "_msg_part(record)",
+    _OP_LEVEL: "record.level.name",
+    _OP_LOGGER_NAME: "record.logger_name",
+    _OP_GLOBAL_NAME: "record.global_name",
+    _OP_PROCESS_NAME: "record.process.name",
+    _OP_PROCESS_ID: "str(record.process.ident)",
+    _OP_THREAD_NAME: "record.thread.name",
+    _OP_THREAD_ID: "str(record.thread.ident)",
+}
+
+# emitters already generated, shared between `Config`s with an identical program
+_codegen_cache: dict[tuple[tuple[int, object], ...], Callable[[Record], str]] = {}
+
+
+def _codegen_format(ops: tuple[tuple[int, object], ...]) -> Callable[[Record], str]:
+    """
+    Generate a specialized emitter function for a compiled format program. The generated
+    function concatenates the record attributes directly — no dispatch loop, no intermediate
+    list — and is shared between configs whose programs are identical.
+
+    Parameters:
+        - `ops: tuple[tuple[int, object], ...]` - Program produced by `_compile_format`.
+
+    Returns: `Callable[[Record], str]` - Function mapping a record to its formatted string.
+    """
+    emit = _codegen_cache.get(ops)
+    if emit is not None:
+        return emit
+
+    exprs: list[str] = []
+    for op, arg in ops:
+        if op == _OP_LITERAL:
+            exprs.append(repr(arg))
+        elif op == _OP_TIME:
+            exprs.append(f"_format_datetime(record.date_time, {arg!r})")
+        elif op == _OP_TRACE:
+            exprs.append(f"_trace_emitters[{arg!r}](record)")
+        elif op == _OP_EXTRA:
+            exprs.append(f"_extra_part(record, {arg!r})")
+        else:
+            exprs.append(_CODEGEN_EXPRS[op])
+
+    source = "def _emit(record):\n    return " + (" + ".join(exprs) or '""')
+    namespace: dict[str, object] = {
+        "_msg_part": _msg_part,
+        "_extra_part": _extra_part,
+        "_format_datetime": format_datetime,
+        "_trace_emitters": _TRACE_EMITTERS,
+    }
+    # templates are developer-supplied at `Config` construction, never user input
+    exec(compile(source, "<pytraced-format>", "exec"), namespace)  # pylint: disable=exec-used
+
+    emit = namespace["_emit"]  # type: ignore[assignment]
+    _codegen_cache[ops] = emit  # type: ignore[assignment]
+    return emit  # type: ignore[return-value]
 
 
 def format_record(record: Record, config: Config) -> str:
@@ -163,22 +420,73 @@ def format_record(record: Record, config: Config) -> str:
     Raises:
         - `InvalidFormatSpecifierError` - Raised if parser encounters an invalid format specifier.
     """
-    assert isinstance(config.formatter, str)
-    logging_string = _format(config.formatter, record)
-
-    if record.exception is not None:
-        # make sure the exception is on a newline unless the log is empty
-        if logging_string:
-            logging_string += "\n"
-        logging_string += "".join(format_exception(record.exception))
+    # `Config.__post_init__` validated the formatter and prebuilt the emitter for string
+    # formatters; callable formatters are dispatched by the sink before reaching here
+    emit = config._emit  # pylint: disable=protected-access
+    if emit is None:
+        raise TypeError("cannot format a record with a callable formatter config")
+
+    # straight-line common case: no exception to expand
+    if record.exception is None:
+        logging_string = emit(record) + "\n"
     else:
-        logging_string += "\n"
+        parts = [emit(record)]
+        # make sure the exception is on a newline unless the log is empty
+        if parts[0]:
+            parts.append("\n")
+        parts.append(_format_exc(record.exception))
+        logging_string = "".join(parts)
 
-    if config.colourise and record.level.colours is not None:
-        return add_colours(logging_string, *record.level.colours)
+    if config.colourise:
+        ansi = record.level._ansi  # pylint: disable=protected-access
+        if ansi is not None:
+            return f"{ansi[0]}{logging_string}{ansi[1]}"
 
     return logging_string
 
 
+def format_records(records: list[Record], config: Config) -> list[str]:
+    """
+    Create logging strings for a batch of records according to the config. The per-record
+    config work (emitter lookup, colourise check) is hoisted out of the loop, so buffering
+    sinks flushing many records pay it once per flush rather than once per record.
+
+    Parameters:
+        - `records: list[Record]` - Records containing the information collected at runtime.
+        - `config: Config` - Config which dictates where the info should be placed in the logs.
+
+    Returns: `list[str]` - Formatted logging strings ready for printing, in record order.
+
+    Raises:
+        - `InvalidFormatSpecifierError` - Raised if parser encounters an invalid format specifier.
+    """
+    emit = config._emit  # pylint: disable=protected-access
+    if emit is None:
+        raise TypeError("cannot format a record with a callable formatter config")
+
+    colourise = config.colourise
+    logging_strings: list[str] = []
+
+    for record in records:
+        if record.exception is None:
+            logging_string = emit(record) + "\n"
+        else:
+            parts = [emit(record)]
+            if parts[0]:
+                parts.append("\n")
+            parts.append(_format_exc(record.exception))
+            logging_string = "".join(parts)
+
+        if colourise:
+            ansi = record.level._ansi  # pylint: disable=protected-access
+            if ansi is not None:
+                logging_string = f"{ansi[0]}{logging_string}{ansi[1]}"
+
+        logging_strings.append(logging_string)
+
+    return logging_strings
+
+
 if Config.CACHE_FORMATTED_PATHS:
-    _format_path = lru_cache(maxsize=None)(_format_path)
+    # bounded so diverse paths in a long-lived process cannot grow the cache without limit
+    _format_path = lru_cache(maxsize=Config.FORMATTED_PATHS_CACHE_SIZE)(_format_path)
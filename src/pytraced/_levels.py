@@ -16,7 +16,8 @@ Functions:
 from dataclasses import dataclass, field
 from typing import Iterable
 
-from .colours import BgColour, Colour, FgColour
+from .colours import BgColour, Colour, FgColour, Meta
+from .colours._colouriser import _get_colours
 
 
 class LevelDoesNotExistError(Exception):
@@ -42,6 +43,16 @@ class Level:
     name: str
     severity: int
     colours: Iterable[Colour] | None = field(default=None)
+    _ansi: tuple[str, str] | None = field(
+        init=False, repr=False, compare=False, default=None
+    )
+
+    def __post_init__(self) -> None:
+        # precompute the ANSI prefix/suffix once so colourising a log is pure concatenation
+        if self.colours is not None:
+            object.__setattr__(
+                self, "_ansi", (_get_colours(*self.colours), _get_colours(Meta.RESET))
+            )
 
 
 def get_defaults() -> dict[str, Level]:
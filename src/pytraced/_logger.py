@@ -9,8 +9,7 @@ Classes:
 from __future__ import annotations
 
 from atexit import register as atexit_register
-from datetime import datetime
-from functools import partial, update_wrapper
+from functools import update_wrapper
 from inspect import (
     isasyncgenfunction,
     isclass,
@@ -20,8 +19,9 @@ from inspect import (
 from multiprocessing import current_process
 from os import PathLike
 from pathlib import Path
-from sys import exc_info
-from threading import current_thread
+from sys import exc_info, intern
+from threading import Thread, current_thread
+from time import sleep
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -30,19 +30,28 @@ from typing import (
     ContextManager,
     Generator,
     Iterable,
-    Iterator,
     Mapping,
     ParamSpec,
+    TextIO,
     TypeVar,
     overload,
 )
+from weakref import WeakSet
 
 from ._catcher import Catcher
 from ._config import Config
+from ._datetime import get_datetime
 from ._levels import Level, LevelDoesNotExistError, get_defaults
 from ._record import Record
-from ._sink import Sink, SinkDoesNotExistError, SyncSink
-from ._traceback import extract_error_frame, get_frame
+from ._sink import AsyncSink, Sink, SinkDoesNotExistError, SyncSink
+from ._traceback import extract_error_frame, getframe
+from ._wrappers import (
+    _LazyMessage,
+    _wrap_async_generator,
+    _wrap_coroutine,
+    _wrap_function,
+    _wrap_generator,
+)
 from .colours import Colour, should_colourise, should_wrap, wrap
 
 if TYPE_CHECKING:
@@ -53,6 +62,59 @@ if TYPE_CHECKING:
     E = TypeVar("E", bound=BaseException)
 
 
+# buffer size for file sinks; a large block buffer batches many logs per write syscall
+# instead of flushing every few lines at the io default
+_FILE_BUFFER_SIZE = 64 * 1024
+
+# shared default levels; every logger starts with this dict and copies it the first time
+# its own level set is modified (see the copy-on-write branches in `add_level` and
+# `remove_level`) - the shared instance itself is never mutated
+_DEFAULT_LEVELS: dict[str, Level] = get_defaults()
+
+# placeholders given to records whose corresponding fields provably cannot be read, so
+# `_log` skips capturing them; the process/thread placeholders are the importing ones
+_UNREAD_DATETIME = get_datetime()
+_UNREAD_FRAME = getframe(0)
+_UNREAD_GLOBAL_NAME = __name__
+_UNREAD_PROCESS = current_process()
+_UNREAD_THREAD = current_thread()
+
+
+# files opened for path sinks, closed by one consolidated exit handler instead of one
+# atexit callback per file; held weakly so removed sinks don't stay pinned until exit
+_OPEN_FILES: WeakSet[TextIO] = WeakSet()
+
+
+def _close_open_files() -> None:
+    """Close every file opened for a path sink which is still open at interpreter exit."""
+    for file in _OPEN_FILES:
+        file.close()
+
+
+atexit_register(_close_open_files)
+
+
+def _start_periodic_flush(file: SupportsWrite[str], interval: float) -> None:
+    """
+    Start a daemon thread which flushes the given file every `interval` seconds, bounding
+    how long a buffered log can sit in memory before reaching disk.
+
+    Parameters:
+        - `file: SupportsWrite[str]` - Open file to flush periodically.
+        - `interval: float` - Seconds to wait between flushes.
+    """
+
+    def _flush() -> None:
+        while True:
+            sleep(interval)
+            try:
+                file.flush()  # type: ignore[attr-defined]
+            except ValueError:  # file has been closed; nothing left to flush
+                return
+
+    Thread(target=_flush, daemon=True, name="pytraced-flusher").start()
+
+
 class Logger:
     """
     Main class which manages the creation and dispatch of logs to its sinks.
@@ -81,29 +143,136 @@ class Logger:
         - `disable` - Disable logging for a specific module.
     """
 
-    __slots__ = "name", "_levels", "_sinks", "_disabled_for", "_sink_id_getter"
+    __slots__ = (
+        "name",
+        "_levels",
+        "_sinks",
+        "_sink_plan",
+        "_dispatch",
+        "_min_sink_level",
+        "_needs_datetime",
+        "_needs_frame",
+        "_needs_process",
+        "_needs_thread",
+        "_disabled_for",
+        "_disabled_first_segments",
+        "_disabled_cache",
+        "_next_sink_id",
+        "_info_level",
+        "_debug_level",
+        "_trace_level",
+        "_success_level",
+        "_warning_level",
+        "_error_level",
+        "_critical_level",
+    )
 
     def __init__(self, name: str) -> None:
         self.name = name
-        self._levels = get_defaults()
+        self._levels: dict[str, Level] = _DEFAULT_LEVELS
         self._sinks: dict[int, Sink] = {}
+        self._sink_plan: tuple[
+            tuple[
+                int,
+                Callable[[Record], bool] | None,
+                Callable[[str], None],
+                Callable[[Record], str],
+            ],
+            ...,
+        ] = ()
+        self._dispatch: Callable[[Record, int], None] = lambda record, severity: None
+        self._min_sink_level = 0
+        self._needs_datetime = True
+        self._needs_frame = True
+        self._needs_process = True
+        self._needs_thread = True
         self._disabled_for: set[str] = set()
-        self._sink_id_getter = self._sink_id_generator()
+        self._disabled_first_segments: frozenset[str] = frozenset()
+        self._disabled_cache: dict[str, bool] = {}
+        self._next_sink_id = 0
+        self._refresh_default_levels()
         atexit_register(self._close)
 
     def __repr__(self) -> str:
         return f"{type(self).__name__}(name={self.name!r})"
 
-    def _sink_id_generator(self) -> Iterator[int]:
+    def _refresh_default_levels(self) -> None:
         """
-        This is function returns an iterator which should be used to generate ids for all sinks.
+        Pre-resolve the levels used by the convenience methods (`info`, `debug`, ...) so
+        they skip the per-call string lookup in `_log`. Falls back to the string name when
+        a default level has been removed, preserving `_log`'s error behaviour. Called
+        whenever the level set changes.
+        """
+        levels: dict[str, str | Level] = self._levels  # type: ignore[assignment]
+        self._info_level = levels.get("INFO", "INFO")
+        self._debug_level = levels.get("DEBUG", "DEBUG")
+        self._trace_level = levels.get("TRACE", "TRACE")
+        self._success_level = levels.get("SUCCESS", "SUCCESS")
+        self._warning_level = levels.get("WARNING", "WARNING")
+        self._error_level = levels.get("ERROR", "ERROR")
+        self._critical_level = levels.get("CRITICAL", "CRITICAL")
 
-        Returns: `Iterator[int]` - Iterator which produces unique ids for new sinks.
+    def _refresh_disabled_cache(self) -> None:
         """
-        cur_id = 0
-        while True:
-            yield cur_id
-            cur_id += 1
+        Drop memoised disabled verdicts and recompute the set of first segments of the
+        disabled module names. Called whenever `enable`/`disable` changes the disabled set.
+        """
+        self._disabled_cache.clear()
+        self._disabled_first_segments = frozenset(
+            name.partition(".")[0] for name in self._disabled_for
+        )
+
+    def _refresh_sink_cache(self) -> None:
+        """
+        Rebuild the dispatch plan and the minimum severity any sink will accept. Called
+        whenever the sink set changes so `_log` pays no attribute chains per record: each
+        entry is `(min_level, filter_func, write, format)`, sorted by ascending min_level
+        so the dispatch loop can stop at the first sink the severity cannot reach.
+        """
+        self._sink_plan = tuple(
+            sorted(
+                (
+                    (
+                        sink.config.min_level,
+                        sink.config.filter_func,
+                        sink.write,
+                        sink.format,
+                    )
+                    for sink in self._sinks.values()
+                ),
+                key=lambda entry: entry[0],
+            )
+        )
+        self._min_sink_level = self._sink_plan[0][0] if self._sink_plan else 0
+
+        # unroll the dispatch loop into a specialized function, in the spirit of the
+        # emitters `_codegen_format` builds: thresholds are inlined as constants and each
+        # sink's write, format, and filter are pre-bound, leaving straight-line code
+        lines = ["def _dispatch(record, severity):"]
+        namespace: dict[str, object] = {}
+        for index, (min_level, filter_func, write, format_) in enumerate(self._sink_plan):
+            namespace[f"_write{index}"] = write
+            namespace[f"_format{index}"] = format_
+            condition = f"severity >= {min_level}"
+            if filter_func is not None:
+                namespace[f"_filter{index}"] = filter_func
+                condition += f" and _filter{index}(record)"
+            lines.append(f"    if {condition}:")
+            lines.append(f"        _write{index}(_format{index}(record))")
+        if not self._sink_plan:
+            lines.append("    pass")
+        # the unrolled source only embeds integer thresholds, never user input
+        exec(  # pylint: disable=exec-used
+            compile("\n".join(lines), "<pytraced-dispatch>", "exec"), namespace
+        )
+        self._dispatch = namespace["_dispatch"]  # type: ignore[assignment]
+        # pylint: disable=protected-access
+        configs = [sink.config for sink in self._sinks.values()]
+        has_filter = any(config.filter_func is not None for config in configs)
+        self._needs_datetime = has_filter or any(c._uses_datetime for c in configs)
+        self._needs_frame = has_filter or any(c._uses_frame for c in configs)
+        self._needs_process = has_filter or any(c._uses_process for c in configs)
+        self._needs_thread = has_filter or any(c._uses_thread for c in configs)
 
     def _close(self) -> None:
         """Iterate through all sinks and call their `close` method."""
@@ -124,17 +293,31 @@ class Logger:
         if not self._disabled_for:
             return False
 
-        mod_name, *parts = name.split(".")
+        # a module can only be disabled if its root package is the root of some disabled
+        # name, so one set probe settles almost every negative check without caching it
+        dot = name.find(".")
+        if (name if dot < 0 else name[:dot]) not in self._disabled_first_segments:
+            return False
 
-        if mod_name in self._disabled_for:
-            return True
+        # the set of module names logging from is small and stable, so memoise the verdict
+        # per name; the cache is cleared whenever `enable`/`disable` changes the set
+        disabled = self._disabled_cache.get(name)
+        if disabled is not None:
+            return disabled
 
-        for sub_mod in parts:
-            mod_name += "." + sub_mod
-            if mod_name in self._disabled_for:
-                return True
+        # check each parent-package prefix by slicing up to successive dots, avoiding the
+        # list allocation and string rebuilding of splitting and re-joining the name
+        disabled = False
+        while True:
+            if (name if dot < 0 else name[:dot]) in self._disabled_for:
+                disabled = True
+                break
+            if dot < 0:
+                break
+            dot = name.find(".", dot + 1)
 
-        return False
+        self._disabled_cache[name] = disabled
+        return disabled
 
     def _log(
         self,
@@ -149,49 +332,78 @@ class Logger:
 
         Parameters:
             - `level: str | Level` - Severity of the log.
-            - `message: object` - Message or additional information.
+            - `message: object` - Message or additional information. A zero-argument callable
+                                  is only invoked once the record is known to be written,
+                                  deferring expensive formatting for filtered-out logs.
             - `exception: BaseException | None = None` - Optional exception to print with the log.
             - `stack_level: int = 2` - Int which stores how many calls back the logger called from.
 
         Raises:
             - `LevelDoesNotExistError` - Raised if a string level does not exist.
         """
-        if not self._sinks.values():
-            return
-
-        frame = get_frame(stack_level)
-        global_name: str = frame.f_globals["__name__"]
-
-        if self._is_disabled_for(global_name):
+        sink_plan = self._sink_plan
+        if not sink_plan:
             return
 
         if isinstance(level, str):
-            if level not in self._levels:
+            resolved = self._levels.get(level)
+            if resolved is None:
                 raise LevelDoesNotExistError(f"level {level!r} does not exist")
 
-            level = self._levels[level]
+            level = resolved
+
+        # is-enabled short-circuit: when no sink would accept this severity, skip the
+        # frame, datetime, process & thread introspection entirely
+        severity = level.severity
+        if severity < self._min_sink_level:
+            return
+
+        # the frame walk only happens when something can read it (a trace or global-name
+        # specifier, a filter, or a callable formatter) or the disabled set needs the
+        # caller's module name; message-embedded specifiers re-capture it below
+        if self._needs_frame or self._disabled_for:
+            frame = getframe(stack_level)
+            global_name: str = frame.f_globals["__name__"]
+
+            if self._is_disabled_for(global_name):
+                return
+        else:
+            frame = _UNREAD_FRAME
+            global_name = _UNREAD_GLOBAL_NAME
+
+        # deferred formatting: only render a lazy message once the record is known to be
+        # written, so logs dropped above never pay for its repr/str work
+        if isinstance(message, _LazyMessage):
+            message = message()
+        message = str(message)
+
+        # only capture runtime context something can actually read: a specifier in a sink
+        # format or the message itself, a filter function, or a callable formatter
+        specifiers_in_message = "%{" in message
+        if specifiers_in_message and frame is _UNREAD_FRAME:
+            frame = getframe(stack_level)
+            global_name = frame.f_globals["__name__"]
 
         record = Record(
             self.name,
             global_name,
             level,
-            datetime.now(),
+            get_datetime()
+            if self._needs_datetime or specifiers_in_message
+            else _UNREAD_DATETIME,
             frame,
-            str(message),
-            current_process(),
-            current_thread(),
+            message,
+            current_process()
+            if self._needs_process or specifiers_in_message
+            else _UNREAD_PROCESS,
+            current_thread()
+            if self._needs_thread or specifiers_in_message
+            else _UNREAD_THREAD,
             extra_info,
             exception,
         )
 
-        for sink in self._sinks.values():
-            if record.level.severity < sink.config.min_level or (
-                sink.config.filter_func is not None
-                and not sink.config.filter_func(record)
-            ):
-                continue
-
-            sink.write(sink.format(record))
+        self._dispatch(record, severity)
 
     def log(self, level: str | Level, message: object) -> None:
         """
@@ -213,7 +425,7 @@ class Logger:
         Parameters:
             - `message: object` - Additional information to add to the log.
         """
-        self._log("INFO", message)
+        self._log(self._info_level, message)
 
     def debug(self, message: object) -> None:
         """
@@ -222,7 +434,7 @@ class Logger:
         Parameters:
             - `message: object` - Additional information to add to the log.
         """
-        self._log("DEBUG", message)
+        self._log(self._debug_level, message)
 
     def trace(self, message: object) -> None:
         """
@@ -231,7 +443,7 @@ class Logger:
         Parameters:
             - `message: object` - Additional information to add to the log.
         """
-        self._log("TRACE", message)
+        self._log(self._trace_level, message)
 
     def success(self, message: object) -> None:
         """
@@ -240,7 +452,7 @@ class Logger:
         Parameters:
             - `message: object` - Additional information to add to the log.
         """
-        self._log("SUCCESS", message)
+        self._log(self._success_level, message)
 
     def warning(self, message: object) -> None:
         """
@@ -249,7 +461,7 @@ class Logger:
         Parameters:
             - `message: object` - Additional information to add to the log.
         """
-        self._log("WARNING", message)
+        self._log(self._warning_level, message)
 
     def error(self, message: object) -> None:
         """
@@ -258,7 +470,7 @@ class Logger:
         Parameters:
             - `message: object` - Additional information to add to the log.
         """
-        self._log("ERROR", message)
+        self._log(self._error_level, message)
 
     def critical(self, message: object) -> None:
         """
@@ -267,7 +479,7 @@ class Logger:
         Parameters:
             - `message: object` - Additional information to add to the log.
         """
-        self._log("CRITICAL", message)
+        self._log(self._critical_level, message)
 
     def exception(
         self,
@@ -308,162 +520,15 @@ class Logger:
         """
 
         def _decorator(func: Callable[P, R]) -> Callable[P, R]:
+            _log_wrapper: Callable[P, Any]
             if isgeneratorfunction(func):
-
-                def _log_wrapper(
-                    *args: P.args, **kwargs: P.kwargs
-                ) -> Generator[Any, Any, Any]:
-                    self._log(
-                        level,
-                        f"Generator {func.__name__!r} called with args: "
-                        f"{args!r} and kwargs: {kwargs!r}",
-                    )
-
-                    # The following code is semantically equivalent to "yield from".
-                    # More info: https://peps.python.org/pep-0380/#formal-semantics
-                    gen = func(*args, **kwargs)
-                    try:
-                        yielded = next(gen)
-                        received = None
-
-                        while True:
-                            self._log(
-                                level,
-                                f"Generator {func.__name__!r} yielded {yielded!r}"
-                                f" and was sent {received!r}",
-                            )
-
-                            try:
-                                received = yield yielded
-
-                                try:
-                                    if received is None:
-                                        yielded = next(gen)
-                                    else:
-                                        yielded = gen.send(received)
-                                except StopIteration as stop_iter:
-                                    stop_iter_val = stop_iter.value
-                                    break
-                            except GeneratorExit as gen_exit:
-                                if hasattr(gen, "close") and callable(gen.close):
-                                    gen.close()
-                                raise gen_exit
-                            except BaseException as exc:
-                                if not hasattr(gen, "throw") or not callable(gen.throw):
-                                    raise exc
-
-                                try:
-                                    yielded = gen.throw(exc)
-                                except StopIteration as stop_iter:
-                                    stop_iter_val = stop_iter.value
-                                    break
-                    except StopIteration as stop_iter:
-                        stop_iter_val = stop_iter.value
-
-                    # pylint: disable=used-before-assignment
-                    self._log(
-                        level,
-                        f"Generator {func.__name__!r} exhausted with value {stop_iter_val!r}",
-                    )
-                    return stop_iter_val
-
+                _log_wrapper = _wrap_generator(self._log, level, func)
             elif isasyncgenfunction(func):
-
-                async def _log_wrapper(  # type: ignore[misc]
-                    *args: P.args, **kwargs: P.kwargs
-                ) -> AsyncGenerator[Any, Any]:
-                    self._log(
-                        level,
-                        f"Async Generator {func.__name__!r} called with args: "
-                        f"{args!r} and kwargs: {kwargs!r}",
-                    )
-
-                    # The following code is semantically equivalent to "yield from".
-                    # More info: https://peps.python.org/pep-0380/#formal-semantics
-                    gen = func(*args, **kwargs)
-                    try:
-                        yielded = await anext(gen)
-                        received = None
-
-                        while True:
-                            self._log(
-                                level,
-                                f"Async Generator {func.__name__!r} yielded {yielded!r}"
-                                f" and was sent {received!r}",
-                            )
-
-                            try:
-                                received = yield yielded
-
-                                try:
-                                    if received is None:
-                                        yielded = await anext(gen)
-                                    else:
-                                        yielded = await gen.asend(received)
-                                except StopAsyncIteration:
-                                    break
-                            except GeneratorExit as gen_exit:
-                                if hasattr(gen, "aclose") and callable(gen.aclose):
-                                    await gen.aclose()
-                                raise gen_exit
-                            except BaseException as exc:
-                                # XXX: reimplement if possible
-                                # Check if the exception was raised in the subgenerator, if so
-                                # reraise it instead of sending it back with `athrow`. This is done
-                                # because (as of writing) exceptions raised during the excution of
-                                # the subgenerator will not bubble up to the caller if thrown back
-                                # to the subgenerator as is the case with normal generators.
-                                if (
-                                    extract_error_frame(exc).f_code.co_name
-                                    == func.__name__
-                                ):
-                                    raise exc
-
-                                if not hasattr(gen, "athrow") or not callable(
-                                    gen.athrow
-                                ):
-                                    raise exc
-
-                                try:
-                                    yielded = await gen.athrow(exc)
-                                except StopAsyncIteration:
-                                    break
-                    except StopAsyncIteration:
-                        pass
-
-                    # pylint: disable=used-before-assignment
-                    self._log(
-                        level,
-                        f"Async Generator {func.__name__!r} exhausted",
-                    )
-
+                _log_wrapper = _wrap_async_generator(self._log, level, func)
             elif iscoroutinefunction(func):
-
-                async def _log_wrapper(  # type: ignore[misc]
-                    *args: P.args, **kwargs: P.kwargs
-                ) -> Any:
-                    self._log(
-                        level,
-                        f"Async function {func.__name__!r} called with args: "
-                        f"{args!r} and kwargs: {kwargs!r}",
-                    )
-                    res = await func(*args, **kwargs)
-                    self._log(
-                        level, f"Async function {func.__name__!r} returned {res!r}"
-                    )
-                    return res
-
+                _log_wrapper = _wrap_coroutine(self._log, level, func)
             else:
-
-                def _log_wrapper(*args: P.args, **kwargs: P.kwargs) -> Any:  # type: ignore[misc]
-                    self._log(
-                        level,
-                        f"Function {func.__name__!r} called with args: "
-                        f"{args!r} and kwargs: {kwargs!r}",
-                    )
-                    res = func(*args, **kwargs)
-                    self._log(level, f"Function {func.__name__!r} returned {res!r}")
-                    return res
+                _log_wrapper = _wrap_function(self._log, level, func)
 
             update_wrapper(_log_wrapper, func)
             return _log_wrapper  # type: ignore[return-value]
@@ -528,18 +593,6 @@ class Logger:
             return self.catch_func()(exception)  # type: ignore
 
         def _decorator(func: Callable[P, R]) -> Callable[P, R]:
-            catcher = partial(
-                Catcher,
-                True,
-                self,
-                message,
-                level,
-                exception,
-                exclude,
-                reraise,
-                on_error,
-            )
-
             extra_info = {"%{fname}%": func.__name__}
 
             if isgeneratorfunction(func):
@@ -548,7 +601,7 @@ class Logger:
                 def _catch_wrapper(
                     *args: P.args, **kwargs: P.kwargs
                 ) -> Generator[Any, Any, Any]:
-                    with catcher(extra_info):
+                    with catcher:
                         return (yield from func(*args, **kwargs))
                     return default
 
@@ -560,11 +613,16 @@ class Logger:
                 ) -> AsyncGenerator[Any, Any]:
                     # pylint: disable=line-too-long
 
-                    with catcher(extra_info):
+                    with catcher:
                         # Async "yield from" does not exist so the following is the semantic equivalent.
                         # No async "yield from": https://peps.python.org/pep-0525/#asynchronous-yield-from
                         # "yield from" semantic equivalent: https://peps.python.org/pep-0380/#formal-semantics
                         gen = func(*args, **kwargs)
+                        # probe the optional generator methods once rather than
+                        # hasattr-ing in the exception paths
+                        gen_aclose = getattr(gen, "aclose", None)
+                        gen_athrow = getattr(gen, "athrow", None)
+                        func_code = func.__code__
                         try:
                             yielded = await anext(gen)
 
@@ -580,8 +638,8 @@ class Logger:
                                     except StopAsyncIteration:
                                         break
                                 except GeneratorExit as gen_exit:
-                                    if hasattr(gen, "aclose") and callable(gen.aclose):
-                                        await gen.aclose()
+                                    if callable(gen_aclose):
+                                        await gen_aclose()
 
                                     raise gen_exit
                                 except BaseException as exc:
@@ -592,19 +650,17 @@ class Logger:
                                     # the excution of the subgenerator will not bubble up to the caller if
                                     # thrown back to the subgenerator as is the case with normal
                                     # generators.
-                                    if (
-                                        extract_error_frame(exc).f_code.co_name
-                                        == func.__name__
-                                    ):
+                                    # identity compare on the code object: faster than
+                                    # the name comparison and immune to same-named
+                                    # functions
+                                    if extract_error_frame(exc).f_code is func_code:
                                         raise exc
 
-                                    if not hasattr(gen, "athrow") or not callable(
-                                        gen.athrow
-                                    ):
+                                    if not callable(gen_athrow):
                                         raise exc
 
                                     try:
-                                        yielded = await gen.athrow(exc)
+                                        yielded = await gen_athrow(exc)
                                     except StopAsyncIteration:
                                         break
                         except StopAsyncIteration:
@@ -616,7 +672,7 @@ class Logger:
                 async def _catch_wrapper(  # type: ignore[misc]
                     *args: P.args, **kwargs: P.kwargs
                 ) -> Any:
-                    with catcher(extra_info):
+                    with catcher:
                         return await func(*args, **kwargs)
                     return default
 
@@ -624,10 +680,24 @@ class Logger:
                 extra_info["%{ftype}%"] = "Function"
 
                 def _catch_wrapper(*args: P.args, **kwargs: P.kwargs) -> Any:  # type: ignore[misc]
-                    with catcher(extra_info):
+                    with catcher:
                         return func(*args, **kwargs)
                     return default
 
+            # `extra_info` is complete by now, so one reusable instance serves every call
+            # of the decorated function; `Catcher` keeps no per-entry state
+            catcher = Catcher.get(
+                True,
+                self,
+                message,
+                level,
+                exception,
+                exclude,
+                reraise,
+                on_error,
+                extra_info,
+            )
+
             update_wrapper(_catch_wrapper, func)
             return _catch_wrapper  # type: ignore[return-value]
 
@@ -660,7 +730,7 @@ class Logger:
         Raises:
             - `LevelDoesNotExistError` - Raised if a given string level name does not exist.
         """
-        return Catcher(
+        return Catcher.get(
             False, self, message, level, exception, exclude, reraise, on_error, None
         )
 
@@ -672,9 +742,11 @@ class Logger:
         log_format: str | Callable[[Record], str] | Config = Config.DEFAULT_FORMAT,
         log_filter: Callable[[Record], bool] | None = None,
         colourise: bool = True,
+        asynchronous: bool = False,
         on_remove: Callable[[], None] | None = None,
         open_mode: OpenTextMode = "a",
         encoding: str = "utf-8",
+        flush_interval: float | None = None,
     ) -> int:
         """
         Add a new `Sink` to the logger with a custom configuration. If given a subclass of `Sink`
@@ -746,28 +818,45 @@ class Logger:
             - `log_filter` - Function used to determine whether or not a log should be written to
                              the stream. Returning false indicates that a log shouldn't be written.
             - `colourise` - Whether or not to colourise logs (if possible).
+            - `asynchronous` - Whether logs should be written by a background worker thread
+                               instead of blocking the logging thread on sink I/O. Queued
+                               logs are flushed when the sink is removed or python exits.
             - `on_remove` - Callback which will be called either when the sink is removed or when
                             python interpreter exits.
             - `open_mode` - Mode used to open a file (if applicable).
             - `encoding` - File encoding used (if applicable).
+            - `flush_interval` - Seconds between background flushes of a file sink's write
+                                 buffer (if applicable). By default the buffer is only
+                                 flushed when full or when the file is closed.
 
         Returns: Id of the `Sink` object.
 
         Raises:
             - `LevelDoesNotExistError` - Raised if a given string level name does not exist.
         """
-        sink_id = next(self._sink_id_getter)
+        sink_id = self._next_sink_id
+        self._next_sink_id += 1
 
         if isinstance(out, Sink):
             self._sinks[sink_id] = out
+            self._refresh_sink_cache()
             return sink_id
 
         if isinstance(out, (str, PathLike)):
             parent = Path(out).parent
-            if not parent.exists():
+            # a bare filename has "." as its parent; skip the stat for that common case
+            if str(parent) != "." and not parent.exists():
                 parent.mkdir(parents=True, exist_ok=True)
-            out = open(file=out, mode=open_mode, encoding=encoding)
-            atexit_register(out.close)
+            out = open(
+                file=out,
+                mode=open_mode,
+                encoding=encoding,
+                buffering=_FILE_BUFFER_SIZE,
+            )
+            _OPEN_FILES.add(out)
+
+            if flush_interval is not None:
+                _start_periodic_flush(out, flush_interval)
 
         if isinstance(min_level, Level):
             min_level = min_level.severity
@@ -784,9 +873,11 @@ class Logger:
                 log_format, log_filter, should_colourise(out) and colourise, min_level
             )
 
-        self._sinks[sink_id] = SyncSink(
+        sink_type = AsyncSink if asynchronous else SyncSink
+        self._sinks[sink_id] = sink_type(
             wrap(out) if should_wrap(out) else out, on_remove, log_format
         )
+        self._refresh_sink_cache()
 
         return sink_id
 
@@ -809,6 +900,7 @@ class Logger:
             sink.close()
 
         del self._sinks[sink_id]
+        self._refresh_sink_cache()
 
     def add_level(
         self, name: str, severity: int = 0, colours: Iterable[Colour] | None = None
@@ -823,8 +915,17 @@ class Logger:
 
         Returns: `Level` - The newly created level.
         """
+        # intern the key so lookups from literal level names resolve on identity before
+        # falling back to a character compare (the defaults are interned by the compiler)
+        name = intern(name)
         level = Level(name, severity, colours)
+
+        # copy-on-write: loggers share the default mapping until their levels diverge
+        if self._levels is _DEFAULT_LEVELS:
+            self._levels = dict(_DEFAULT_LEVELS)
+
         self._levels[name] = level
+        self._refresh_default_levels()
         return level
 
     def remove_level(self, level: str | Level) -> None:
@@ -843,7 +944,12 @@ class Logger:
         if level not in self._levels:
             raise LevelDoesNotExistError(f"level {level!r} does not exist")
 
+        # copy-on-write: loggers share the default mapping until their levels diverge
+        if self._levels is _DEFAULT_LEVELS:
+            self._levels = dict(_DEFAULT_LEVELS)
+
         del self._levels[level]
+        self._refresh_default_levels()
 
     def enable(self, name: str | None = None) -> None:
         """
@@ -854,9 +960,11 @@ class Logger:
                                           this method was called will be enable.
         """
         try:
-            self._disabled_for.remove(name or get_frame(1).f_globals["__name__"])
+            self._disabled_for.remove(name or getframe(1).f_globals["__name__"])
         except KeyError:
             pass
+        else:
+            self._refresh_disabled_cache()
 
     def disable(self, name: str | None = None) -> None:
         """
@@ -866,4 +974,5 @@ class Logger:
             - `name: str | None = None` - Name of the module to disable. If not the module where
                                           this method was called will be disabled.
         """
-        self._disabled_for.add(name or get_frame(1).f_globals["__name__"])
+        self._disabled_for.add(name or getframe(1).f_globals["__name__"])
+        self._refresh_disabled_cache()
@@ -7,11 +7,14 @@ Classes:
     - `SinkDoesNotExistError` - Error raised when attempting to access a sink which does not exist.
     - `Sink` - Abstract base class from which all sinks must inherit.
     - `SyncSink` - Class used for blocking/synchronous logging.
+    - `AsyncSink` - Class used for non-blocking/asynchronous logging.
 """
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
+from queue import SimpleQueue
+from threading import Thread
 from typing import TYPE_CHECKING, Callable
 
 from ._config import Config
@@ -104,3 +107,69 @@ class SyncSink(Sink):
             self.out.write(string)
         else:
             self.out(string)
+
+
+# sentinel pushed onto an `AsyncSink`'s queue to stop its worker thread
+_CLOSE_SENTINEL = object()
+
+
+class AsyncSink(Sink):
+    """
+    Class used for non-blocking/asynchronous logging. Formatted logs are pushed onto an
+    unbounded queue and written to the out by a single daemon worker thread, so logging
+    threads never block on sink I/O.
+
+    Attributes:
+        - `out: SupportsWrite[str] | Callable[[str], object]` - Destination of all formatted logs.
+        - `close: Callable[[], None] | None` - Function which flushes any queued logs, stops the
+                                               worker thread, and calls the close callback the
+                                               sink was constructed with (if any).
+
+    Methods:
+        - `format(record: Record) -> str` - Formats records for printing print
+                                            based on the current config.
+        - `write(string: str) -> None` - Enqueues the string to be written by the worker thread.
+    """
+
+    __slots__ = "_queue", "_worker"
+
+    _queue: SimpleQueue[object]
+    _worker: Thread
+
+    def __init__(
+        self,
+        out: SupportsWrite[str] | Callable[[str], object],
+        close: Callable[[], None] | None,
+        config: Config,
+    ) -> None:
+        def _drain() -> None:
+            out_write = out if callable(out) else out.write
+            while True:
+                string = self._queue.get()
+                if string is _CLOSE_SENTINEL:
+                    break
+                out_write(string)  # type: ignore[arg-type]
+
+        def _close() -> None:
+            # flush everything queued so far, then stop and reap the worker; joining a
+            # worker that already stopped returns immediately
+            self._queue.put(_CLOSE_SENTINEL)
+            self._worker.join()
+            if close is not None:
+                close()
+
+        super().__init__(out, _close, config)
+        object.__setattr__(self, "_queue", SimpleQueue())
+        object.__setattr__(
+            self, "_worker", Thread(target=_drain, daemon=True, name="pytraced-writer")
+        )
+        self._worker.start()
+
+    def write(self, string: str) -> None:
+        """
+        Enqueue the string to be written to the out by the worker thread.
+
+        Parameters:
+            - `string: str` - String to be written to the out.
+        """
+        self._queue.put(string)
@@ -4,8 +4,8 @@ _traceback.py:
 This file contains all of the functions used for interacting with Python stack frames.
 
 Functions:
-    - `get_frame` - Get the currently executing frame at a specified depth.
-    - `extract_stack` - Get a `StackSummary` object from a `FrameType` object.
+    - `getframe` - Get the currently executing frame at a specified depth.
+    - `extract_error_frame` - Get the frame where an exception was raised.
 """
 import sys
 from types import FrameType
@@ -13,18 +13,6 @@ from types import FrameType
 # pylint: disable=broad-exception-caught, broad-exception-raised, protected-access, ungrouped-imports
 
 
-def _get_frame(depth: int = 0) -> FrameType:
-    """
-    Get the currently executing frame at a specified depth.
-
-    Parameters:
-        - `depth: int = 0` - Depth at which to return the frame.
-
-    Returns: `FrameType` - Currently executing frame at the specified depth.
-    """
-    return sys._getframe(depth + 1)  # offset current frame
-
-
 def _get_frame_fallback(depth: int = 0) -> FrameType:
     """
     Fallback to get the currently executing frame if `sys._getframe` does not exist.
@@ -44,7 +32,9 @@ def _get_frame_fallback(depth: int = 0) -> FrameType:
         return frame
 
 
-get_frame = _get_frame if hasattr(sys, "_getframe") else _get_frame_fallback
+# bound straight to the builtin where it exists so frame access is a direct C call with
+# no wrapper frame; the fallback walker already counts depth from its caller
+getframe = sys._getframe if hasattr(sys, "_getframe") else _get_frame_fallback
 
 
 def extract_error_frame(exc: BaseException) -> FrameType:
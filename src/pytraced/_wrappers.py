@@ -0,0 +1,257 @@
+"""
+_wrappers.py:
+
+This file contains the wrapper factories used by `Logger.log_func` to instrument plain,
+async, generator, & async generator functions, and the lazy message type used to defer
+rendering the wrappers' log messages.
+
+Classes:
+    - `_LazyMessage` - Zero-argument message thunk rendered only once a log is written.
+
+Functions:
+    - `_wrap_function` - Wrap a plain function, logging its arguments and return value.
+    - `_wrap_coroutine` - Wrap an async function, logging its arguments and return value.
+    - `_wrap_generator` - Wrap a generator function, logging its yields and final value.
+    - `_wrap_async_generator` - Wrap an async generator function, logging its yields.
+"""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, AsyncGenerator, Callable, Generator, ParamSpec
+
+from ._traceback import extract_error_frame
+
+# the async generator wrapper intentionally mirrors the yield-from reimplementation in
+# `Logger.catch_func`; the two diverge in what they log and cannot share a body
+# pylint: disable=duplicate-code
+
+if TYPE_CHECKING:
+    from ._levels import Level
+
+    P = ParamSpec("P")
+
+    # the wrappers only ever pass a level and a message; the remaining `Logger._log`
+    # parameters keep their defaults
+    _LogFn = Callable[["str | Level", object], None]
+
+
+class _LazyMessage:  # pylint: disable=too-few-public-methods
+    """
+    Zero-argument message thunk built by the `log_func` wrappers. `Logger._log` only
+    renders one once the record is known to be written, so dropped logs never pay its
+    repr work. A private marker type rather than a `callable` probe: `message` is
+    documented as taking any object, so user-supplied callables must be logged as-is,
+    never invoked.
+    """
+
+    __slots__ = ("_render",)
+
+    # `...` rather than `[]` so the wrappers' loop-carried lambdas, which bind state
+    # through defaulted parameters, type-check; they are still called with no arguments
+    def __init__(self, render: Callable[..., str]) -> None:
+        self._render = render
+
+    def __call__(self) -> str:
+        return self._render()
+
+
+def _wrap_function(
+    log: _LogFn, level: str | Level, func: Callable[P, Any]
+) -> Callable[P, Any]:
+    """Wrap a plain function, logging its arguments and return value on every call."""
+
+    def _log_wrapper(*args: P.args, **kwargs: P.kwargs) -> Any:
+        log(
+            level,
+            _LazyMessage(
+                lambda: f"Function {func.__name__!r} called with args: "
+                f"{args!r} and kwargs: {kwargs!r}"
+            ),
+        )
+        res = func(*args, **kwargs)
+        log(
+            level,
+            _LazyMessage(lambda: f"Function {func.__name__!r} returned {res!r}"),
+        )
+        return res
+
+    return _log_wrapper
+
+
+def _wrap_coroutine(
+    log: _LogFn, level: str | Level, func: Callable[P, Any]
+) -> Callable[P, Any]:
+    """Wrap an async function, logging its arguments and return value on every call."""
+
+    async def _log_wrapper(*args: P.args, **kwargs: P.kwargs) -> Any:
+        log(
+            level,
+            _LazyMessage(
+                lambda: f"Async function {func.__name__!r} called with "
+                f"args: {args!r} and kwargs: {kwargs!r}"
+            ),
+        )
+        res = await func(*args, **kwargs)
+        log(
+            level,
+            _LazyMessage(lambda: f"Async function {func.__name__!r} returned {res!r}"),
+        )
+        return res
+
+    return _log_wrapper
+
+
+def _wrap_generator(
+    log: _LogFn, level: str | Level, func: Callable[P, Any]
+) -> Callable[P, Generator[Any, Any, Any]]:
+    """Wrap a generator function, logging its yields, sent values, and final value."""
+
+    def _log_wrapper(*args: P.args, **kwargs: P.kwargs) -> Generator[Any, Any, Any]:
+        log(
+            level,
+            _LazyMessage(
+                lambda: f"Generator {func.__name__!r} called with args: "
+                f"{args!r} and kwargs: {kwargs!r}"
+            ),
+        )
+
+        # The following code is semantically equivalent to "yield from".
+        # More info: https://peps.python.org/pep-0380/#formal-semantics
+        gen = func(*args, **kwargs)
+        # probe the optional generator methods once rather than hasattr-ing in
+        # the exception paths; they cannot appear or vanish mid-iteration
+        gen_close = getattr(gen, "close", None)
+        gen_throw = getattr(gen, "throw", None)
+        try:
+            yielded = next(gen)
+            received = None
+
+            while True:
+                log(
+                    level,
+                    _LazyMessage(
+                        lambda y=yielded, r=received: (
+                            f"Generator {func.__name__!r} yielded {y!r}"
+                            f" and was sent {r!r}"
+                        )
+                    ),
+                )
+
+                try:
+                    received = yield yielded
+
+                    try:
+                        if received is None:
+                            yielded = next(gen)
+                        else:
+                            yielded = gen.send(received)
+                    except StopIteration as stop_iter:
+                        stop_iter_val = stop_iter.value
+                        break
+                except GeneratorExit as gen_exit:
+                    if callable(gen_close):
+                        gen_close()
+                    raise gen_exit
+                except BaseException as exc:
+                    if not callable(gen_throw):
+                        raise exc
+
+                    try:
+                        yielded = gen_throw(exc)
+                    except StopIteration as stop_iter:
+                        stop_iter_val = stop_iter.value
+                        break
+        except StopIteration as stop_iter:
+            stop_iter_val = stop_iter.value
+
+        # pylint: disable=used-before-assignment
+        log(
+            level,
+            _LazyMessage(
+                lambda: f"Generator {func.__name__!r} exhausted "
+                f"with value {stop_iter_val!r}"
+            ),
+        )
+        return stop_iter_val
+
+    return _log_wrapper
+
+
+def _wrap_async_generator(
+    log: _LogFn, level: str | Level, func: Callable[P, Any]
+) -> Callable[P, AsyncGenerator[Any, Any]]:
+    """Wrap an async generator function, logging its yields and sent values."""
+
+    async def _log_wrapper(*args: P.args, **kwargs: P.kwargs) -> AsyncGenerator[Any, Any]:
+        log(
+            level,
+            _LazyMessage(
+                lambda: f"Async Generator {func.__name__!r} called with "
+                f"args: {args!r} and kwargs: {kwargs!r}"
+            ),
+        )
+
+        # The following code is semantically equivalent to "yield from".
+        # More info: https://peps.python.org/pep-0380/#formal-semantics
+        gen = func(*args, **kwargs)
+        # probe the optional generator methods once rather than hasattr-ing in
+        # the exception paths; they cannot appear or vanish mid-iteration
+        gen_aclose = getattr(gen, "aclose", None)
+        gen_athrow = getattr(gen, "athrow", None)
+        func_code = func.__code__
+        try:
+            yielded = await anext(gen)
+            received = None
+
+            while True:
+                log(
+                    level,
+                    _LazyMessage(
+                        lambda y=yielded, r=received: (
+                            f"Async Generator {func.__name__!r} yielded"
+                            f" {y!r} and was sent {r!r}"
+                        )
+                    ),
+                )
+
+                try:
+                    received = yield yielded
+
+                    try:
+                        if received is None:
+                            yielded = await anext(gen)
+                        else:
+                            yielded = await gen.asend(received)
+                    except StopAsyncIteration:
+                        break
+                except GeneratorExit as gen_exit:
+                    if callable(gen_aclose):
+                        await gen_aclose()
+                    raise gen_exit
+                except BaseException as exc:
+                    # XXX: reimplement if possible
+                    # Check if the exception was raised in the subgenerator, if so
+                    # reraise it instead of sending it back with `athrow`. This is done
+                    # because (as of writing) exceptions raised during the excution of
+                    # the subgenerator will not bubble up to the caller if thrown back
+                    # to the subgenerator as is the case with normal generators.
+                    # identity compare on the code object: faster than the
+                    # name comparison and immune to same-named functions
+                    if extract_error_frame(exc).f_code is func_code:
+                        raise exc
+
+                    if not callable(gen_athrow):
+                        raise exc
+
+                    try:
+                        yielded = await gen_athrow(exc)
+                    except StopAsyncIteration:
+                        break
+        except StopAsyncIteration:
+            pass
+
+        log(
+            level,
+            f"Async Generator {func.__name__!r} exhausted",
+        )
+
+    return _log_wrapper
@@ -14,7 +14,7 @@ def test_creation() -> None:
     assert catcher.logger is logger
     assert catcher.message is msg
     assert catcher.level == "LOG"
-    assert catcher.exc_types is Exception
+    assert catcher.exc_types == (Exception,)
     assert catcher.reraise is False
     assert catcher.on_error is None
 
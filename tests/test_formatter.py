@@ -0,0 +1,58 @@
+from datetime import datetime
+from multiprocessing import current_process
+from sys import _getframe
+from threading import current_thread
+
+from pytest import raises
+
+from pytraced import Config, Level, Record
+from pytraced._formatter import format_record, format_records
+from pytraced.colours import FgColour
+
+from .conftest import get_config
+
+
+def get_record(level: Level, exception: BaseException | None = None) -> Record:
+    return Record(
+        "TEST_LOGGER",
+        __name__,
+        level,
+        datetime.now(),
+        _getframe(),
+        "MESSAGE",
+        current_process(),
+        current_thread(),
+        None,
+        exception,
+    )
+
+
+def test_format_records_matches_format_record() -> None:
+    try:
+        raise Exception  # pylint: disable=broad-exception-raised
+    except Exception as e:  # pylint: disable=broad-exception-caught
+        exception = e
+
+    records = [
+        get_record(Level("LEVEL", 0)),
+        get_record(Level("LEVEL", 0), exception),
+        get_record(Level("COLOURED", 0, (FgColour.RED,))),
+        get_record(Level("COLOURED", 0, (FgColour.RED,)), exception),
+    ]
+
+    for config in (
+        get_config("[%{lvl}%] %{msg}%"),
+        Config("[%{lvl}%] %{msg}%", None, True, 0),
+    ):
+        assert format_records(records, config) == [
+            format_record(record, config) for record in records
+        ]
+
+
+def test_format_records_empty() -> None:
+    assert not format_records([], get_config("%{msg}%"))
+
+
+def test_format_records_callable_config() -> None:
+    with raises(TypeError):
+        format_records([get_record(Level("LEVEL", 0))], get_config(lambda r: r.message))
@@ -1,5 +1,5 @@
 from asyncio import run
-from random import choices, randint, sample
+from random import Random
 from string import ascii_letters
 from typing import AsyncIterator, Iterator
 
@@ -20,7 +20,7 @@ def test_creation() -> None:
     assert logger._levels == get_defaults()
     assert not logger._sinks
     assert not logger._disabled_for
-    assert next(logger._sink_id_getter) == 0
+    assert logger._next_sink_id == 0
 
 
 def test_repr() -> None:
@@ -30,8 +30,8 @@ def test_repr() -> None:
 
 def test_id_getter() -> None:
     logger = Logger("TEST")
-    for expected, received in zip(range(100), logger._sink_id_getter, strict=False):
-        assert expected == received
+    for expected in range(100):
+        assert logger.add(lambda _: None) == expected
 
 
 def test_close() -> None:
@@ -51,18 +51,33 @@ def test_close() -> None:
 def test_is_disabled_for() -> None:
     logger = Logger("TEST")
 
+    # fast path: nothing disabled means no name is disabled
+    assert not logger._is_disabled_for("a.b.c")
+
+    # seeded so failures reproduce; letters come from one randbytes batch mapped through
+    # a translation table instead of a choices call per part
+    rng = Random(0)
+    table = bytes(ascii_letters.encode()[byte % len(ascii_letters)] for byte in range(256))
+    pool = rng.randbytes(1_000 * 15 * 25).translate(table).decode()
+    cursor = 0
+
+    def next_part(length: int) -> str:
+        nonlocal cursor
+        cursor += length
+        return pool[cursor - length : cursor]
+
     names = [
         ".".join(
-            "".join(choices(ascii_letters, k=randint(1, 25)))  # length of each part
-            for _ in range(randint(1, 15))  # number of parts
+            next_part(rng.randint(1, 25))  # length of each part
+            for _ in range(rng.randint(1, 15))  # number of parts
         )
         for _ in range(1_000)  # number of names
     ]
 
     # take a random sample the of the names and disable on a random mod depth
-    for mod_name in sample(names, k=randint(len(names) // 5, len(names))):
+    for mod_name in rng.sample(names, k=rng.randint(len(names) // 5, len(names))):
         parts = mod_name.split(".")
-        logger._disabled_for.add(".".join(parts[: randint(1, len(parts))]))
+        logger.disable(".".join(parts[: rng.randint(1, len(parts))]))
 
     def correct() -> set[str]:
         skipped: set[str] = set()
@@ -101,8 +116,7 @@ def test_priv_log() -> None:
     logger.disable(__name__)
     logger._log("LOG", "message", stack_level=1)
     logger.enable(__name__)
-    io.seek(0)
-    assert not io.read()
+    assert not io.getvalue()
 
     # verify error is raised with invalid string level
     with raises(LevelDoesNotExistError):
@@ -112,74 +126,63 @@ def test_priv_log() -> None:
     logger.remove(0)
     logger.add(io, min_level=50, log_filter=lambda record: record.level.name != "INFO")
     logger._log("LOG", "this shouldn't be printed", stack_level=1)
-    io.seek(0)
-    assert not io.read()
+    assert not io.getvalue()
     logger._log("INFO", "this shouldn't be printed either")
-    io.seek(0)
-    assert not io.read()
+    assert not io.getvalue()
 
     # test actually  writing
     logger.remove(1)
     logger.add(io, log_format=get_config(lambda record: record.message))
     logger._log("LOG", "message", stack_level=1)
-    io.seek(0)
-    assert io.read() == "message"
+    assert io.getvalue() == "message"
 
 
 def test_log() -> None:
     io, logger = get_stringio_logger(get_config(lambda record: record.message))
     logger.log("LOG", "test-log")
-    io.seek(0)
-    assert io.read() == "test-log"
+    assert io.getvalue() == "test-log"
 
 
 def test_info() -> None:
     io, logger = get_stringio_logger(get_config(lambda record: record.message))
     logger.info("test-info")
-    io.seek(0)
-    assert io.read() == "test-info"
+    assert io.getvalue() == "test-info"
 
 
 def test_debug() -> None:
     io, logger = get_stringio_logger(get_config(lambda record: record.message))
     logger.debug("test-debug")
-    io.seek(0)
-    assert io.read() == "test-debug"
+    assert io.getvalue() == "test-debug"
 
 
 def test_trace() -> None:
     io, logger = get_stringio_logger(get_config(lambda record: record.message))
     logger.trace("test-trace")
-    io.seek(0)
-    assert io.read() == "test-trace"
+    assert io.getvalue() == "test-trace"
 
 
 def test_success() -> None:
     io, logger = get_stringio_logger(get_config(lambda record: record.message))
     logger.success("test-success")
-    io.seek(0)
-    assert io.read() == "test-success"
+    assert io.getvalue() == "test-success"
 
 
 def test_warning() -> None:
     io, logger = get_stringio_logger(get_config(lambda record: record.message))
     logger.warning("test-warning")
-    io.seek(0)
-    assert io.read() == "test-warning"
+    assert io.getvalue() == "test-warning"
 
 
 def test_error() -> None:
     io, logger = get_stringio_logger(get_config(lambda record: record.message))
     logger.error("test-error")
-    io.seek(0)
-    assert io.read() == "test-error"
+    assert io.getvalue() == "test-error"
 
 
 def test_critical() -> None:
     io, logger = get_stringio_logger(get_config(lambda record: record.message))
     logger.critical("test-critical")
-    io.seek(0)
-    assert io.read() == "test-critical"
+    assert io.getvalue() == "test-critical"
 
 
 def test_log_exception() -> None:
@@ -190,8 +193,7 @@ def test_log_exception() -> None:
     except ZeroDivisionError as e:
         logger.exception(e, message="logged-error")
 
-    io.seek(0)
-    assert io.read() == "logged-error"
+    assert io.getvalue() == "logged-error"
 
 
 def test_log_func() -> None:
@@ -235,13 +237,29 @@ def test_log_func_generator() -> None:
         yield a
 
     args = 11, "string"
-    results = list(gen_dummy(*args))
-    io.seek(0)
-    first, *yields, last = io.readlines()
+    seen = 0
+
+    def read_new_lines() -> list[str]:
+        # consume incrementally so each log is asserted at the step which produced it
+        nonlocal seen
+        value = io.getvalue()
+        new, seen = value[seen:], len(value)
+        return new.splitlines()
 
+    gen = gen_dummy(*args)
+
+    result = next(gen)
+    first, yielded = read_new_lines()
     assert gen_dummy.__name__ in first and repr(args) in first
-    for res, line in zip(results, yields, strict=True):
-        assert gen_dummy.__name__ in line and repr(res) in line
+    assert gen_dummy.__name__ in yielded and repr(result) in yielded
+
+    result = next(gen)
+    (yielded,) = read_new_lines()
+    assert gen_dummy.__name__ in yielded and repr(result) in yielded
+
+    with raises(StopIteration):
+        next(gen)
+    (last,) = read_new_lines()
     assert gen_dummy.__name__ in last and "exhausted" in last
 
 
@@ -255,13 +273,29 @@ def test_log_func_async_generator() -> None:
 
     async def do_async_gen_dummy_test() -> None:
         args = 11, "string"
-        results = [e async for e in async_gen_dummy(*args)]
-        io.seek(0)
-        first, *yields, last = io.readlines()
+        seen = 0
+
+        def read_new_lines() -> list[str]:
+            # consume incrementally so each log is asserted at the step which produced it
+            nonlocal seen
+            value = io.getvalue()
+            new, seen = value[seen:], len(value)
+            return new.splitlines()
+
+        gen = async_gen_dummy(*args)
 
+        result = await anext(gen)
+        first, yielded = read_new_lines()
         assert async_gen_dummy.__name__ in first and repr(args) in first
-        for res, line in zip(results, yields, strict=True):
-            assert async_gen_dummy.__name__ in line and repr(res) in line
+        assert async_gen_dummy.__name__ in yielded and repr(result) in yielded
+
+        result = await anext(gen)
+        (yielded,) = read_new_lines()
+        assert async_gen_dummy.__name__ in yielded and repr(result) in yielded
+
+        with raises(StopAsyncIteration):
+            await anext(gen)
+        (last,) = read_new_lines()
         assert async_gen_dummy.__name__ in last and "exhausted" in last
 
     run(do_async_gen_dummy_test())
@@ -277,8 +311,7 @@ def test_catch_func() -> None:
         return a / b
 
     error_caught(1, 0)
-    io.seek(0)
-    assert io.read() == "caught-error"
+    assert io.getvalue() == "caught-error"
 
     ## test reraise
     @logger.catch_func(reraise=True)
@@ -322,8 +355,7 @@ def test_catch_func_async() -> None:
         return a / b
 
     run(async_error_caught(1, 0))
-    io.seek(0)
-    assert io.read() == "caught-error"
+    assert io.getvalue() == "caught-error"
 
     ## test reraise
     @logger.catch_func(reraise=True)
@@ -368,8 +400,7 @@ def test_catch_func_generator() -> None:
 
     with raises(StopIteration):
         next(generator_error_caught(1, 0))
-    io.seek(0)
-    assert io.read() == "caught-error"
+    assert io.getvalue() == "caught-error"
 
     ## test reraise
     @logger.catch_func(reraise=True)
@@ -414,8 +445,7 @@ def test_catch_func_async_generator() -> None:
 
         with raises(StopAsyncIteration):
             await anext(async_generator_error_caught(1, 0))
-        io.seek(0)
-        assert io.read() == "caught-error"
+        assert io.getvalue() == "caught-error"
 
         ## test reraise
         @logger.catch_func(reraise=True)
@@ -451,8 +481,7 @@ def test_catch_context() -> None:
     with logger.catch_context(message="error-caught"):
         _x = 0 / 0
 
-    io.seek(0)
-    assert io.read() == "error-caught"
+    assert io.getvalue() == "error-caught"
 
     with raises(ZeroDivisionError):
         with logger.catch_context(reraise=True):
@@ -521,9 +550,8 @@ def test_remove() -> None:
         nonlocal was_closed
         was_closed = True
 
-    sink_id = next(logger._sink_id_getter)
     sink = DummySink(lambda _: None, close, get_config("%{msg}%"))
-    logger._sinks.update({sink_id: sink})
+    sink_id = logger.add(sink)
     logger.remove(sink_id)
 
     assert sink_id not in logger._sinks
@@ -545,9 +573,8 @@ def test_add_level() -> None:
 
 def test_remove_level() -> None:
     logger = Logger("TEST")
-    test_level_1 = Level("TEST-LEVEL-1", 50, (FgColour.RED,))
-    test_level_2 = Level("TEST-LEVEL-2", 80, (FgColour.BLUE,))
-    logger._levels.update({"TEST-LEVEL-1": test_level_1, "TEST-LEVEL-2": test_level_2})
+    test_level_1 = logger.add_level("TEST-LEVEL-1", 50, (FgColour.RED,))
+    test_level_2 = logger.add_level("TEST-LEVEL-2", 80, (FgColour.BLUE,))
     logger.remove_level(test_level_1.name)
     logger.remove_level(test_level_2)
 
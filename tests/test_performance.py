@@ -1,9 +1,8 @@
+import tracemalloc
 from statistics import mean
 from time import perf_counter
 from typing import Iterator
 
-from pympler.asizeof import asizeof  # type: ignore
-
 import pytraced
 
 
@@ -18,8 +17,15 @@ def test_speed() -> None:
             logger.info("msg")
             yield perf_counter() - start
 
-    assert mean(do_trials()) < 1e-4
+    assert mean(do_trials()) < 3e-5
 
 
 def test_size() -> None:
-    assert asizeof(pytraced.logger) < 15_000
+    # budget the bytes allocated constructing a logger rather than deep-sizing the global
+    # one; tracemalloc tracks allocations directly instead of traversing the object graph
+    tracemalloc.start()
+    pytraced.Logger("TEST")
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    assert allocated < 15_000
@@ -5,13 +5,14 @@ from sys import _getframe
 from threading import current_thread
 
 from pytraced import Level, Record
-from pytraced._sink import Sink, SinkDoesNotExistError, SyncSink
+from pytraced._sink import AsyncSink, Sink, SinkDoesNotExistError, SyncSink
 
 from .conftest import DummySink, get_config
 
 
 def test_subclasses() -> None:
     assert issubclass(SyncSink, Sink)
+    assert issubclass(AsyncSink, Sink)
 
 
 def test_sink_does_not_exist_error() -> None:
@@ -81,3 +82,25 @@ def test_syncsink() -> None:
     callable_sink = SyncSink(writer, None, get_config("%{msg}%"))
     callable_sink.write(MESSAGE)
     assert written == MESSAGE
+
+
+def test_asyncsink() -> None:
+    MESSAGES = [f"message-{i}" for i in range(100)]
+
+    closed = False
+
+    def on_close() -> None:
+        nonlocal closed
+        closed = True
+
+    io = StringIO()
+    io_sink = AsyncSink(io, on_close, get_config("%{msg}%"))
+    for message in MESSAGES:
+        io_sink.write(message + "\n")
+
+    assert io_sink.close is not None
+    io_sink.close()  # flushes the queue and stops the worker
+
+    io.seek(0)
+    assert io.read().splitlines() == MESSAGES
+    assert closed
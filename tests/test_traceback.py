@@ -1,10 +1,10 @@
 from sys import _getframe as sys_getframe
 
-from pytraced._traceback import _get_frame, _get_frame_fallback
+from pytraced._traceback import _get_frame_fallback, getframe
 
 
 def test_get_frame() -> None:
-    test_normal = _get_frame()
+    test_normal = getframe()
     test_fallback = _get_frame_fallback()
     excepted = sys_getframe()
 